@@ -20,31 +20,45 @@ URL Patterns:
 HName Calculation:
     hname = Base32(SHA1(checksum[8B BE] + size[8B BE] + name))
 
+Selective Sync:
+    Full (7-column) asset manifests carry a group and a priority per entry.
+    Passing --group and/or --max-priority syncs only the matching entries of a
+    content category (default: master) from the Generic URL, lowest priority
+    value first, so high-priority assets land on disk before the rest.
+
 Usage:
     python fetch_master_db.py <app_ver> [--output <dir>] [--platform <Windows|iOS|Android>]
+    python fetch_master_db.py <app_ver> [--category <name>] [--group <g>]... [--max-priority <n>]
+    python fetch_master_db.py dump <file.manifest.bsv> [--format <jsonl|csv>] [--entries]
 
 Examples:
     python fetch_master_db.py 10004010
     python fetch_master_db.py 10004010 --output ./downloads
     python fetch_master_db.py 10004010 --platform Android --quiet
+    python fetch_master_db.py 10004010 --category chara --group 1 --group 2 --max-priority 10
+    python fetch_master_db.py dump master.manifest.bsv --entries | jq .hname
 
 Requirements:
     - Python 3.7+
     - lz4 (pip install lz4)
 
-Version: 1.1
-Date: 2026-02-02
+Version: 1.2
+Date: 2026-10-19
 """
 
 import os
 import sys
+import csv
+import json
+import mmap
 import struct
 import hashlib
 import base64
 import argparse
 from pathlib import Path
+from contextlib import closing
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from typing import Callable, Iterable, Iterator, List, Optional, TextIO, Tuple, Union
 
 # Optional imports
 try:
@@ -86,6 +100,15 @@ LZ4_FRAME_MAGIC = b'\x04\x22\x4D\x18'
 DEFAULT_PLATFORM = "Windows"
 DEFAULT_TIMEOUT = 30
 
+# Category manifest entries listed in progress output before summarising
+LOG_ENTRY_LIMIT = 20
+
+# Per-output-directory record of synced assets (JSON Lines: name → hname)
+SYNC_INDEX_NAME = "sync-index.jsonl"
+
+# Buffers the BSV parser reads from without copying
+BSVBuffer = Union[bytes, bytearray, memoryview, mmap.mmap]
+
 
 # =============================================================================
 # DATA STRUCTURES
@@ -101,11 +124,15 @@ class ManifestEntry:
         size: Compressed file size in bytes
         checksum: 64-bit checksum for integrity verification
         hname: Computed hash name for URL construction
+        group: Asset group (full asset format only, else None)
+        priority: Download priority, lower is sooner (full asset format only, else None)
     """
     name: str
     size: int
     checksum: int
     hname: str = ""
+    group: Optional[str] = None
+    priority: Optional[int] = None
     
     def __post_init__(self):
         if not self.hname:
@@ -229,13 +256,26 @@ def decompress_lz4(data: bytes) -> bytes:
 # =============================================================================
 
 class BSVParser:
-    """Simple BSV parser that matches bsv_parser.py logic"""
+    """Simple BSV parser that matches bsv_parser.py logic
+    
+    Accepts any buffer (bytes, memoryview, mmap). Reads go through a
+    memoryview so slicing never copies; text lookups use the underlying
+    buffer's find() (bytes, bytearray, mmap) instead of scanning in Python.
+    A memoryview that covers only part of its object falls back to the scan,
+    since find() offsets would not line up with the view.
+    """
     
     MAGIC_BYTE = 0xBF
     
-    def __init__(self, data: bytes):
-        self.data = data
+    def __init__(self, data: BSVBuffer):
+        self.data = memoryview(data)
         self.offset = 0
+        
+        source = data
+        if isinstance(data, memoryview):
+            whole = data.c_contiguous and data.nbytes == len(data.obj)
+            source = data.obj if whole else None
+        self._find = getattr(source, 'find', None)
     
     def read_vlq(self, max_bytes: int = 8) -> int:
         """Read a variable-length quantity (MSB-first, big-endian style)"""
@@ -265,16 +305,24 @@ class BSVParser:
     def read_text(self) -> str:
         """Read null-terminated text"""
         start = self.offset
-        while self.offset < len(self.data) and self.data[self.offset] != 0:
-            self.offset += 1
-        text = self.data[start:self.offset].decode('utf-8', errors='replace')
+        end = self._find(b'\x00', start) if self._find else -1
+        if end < 0:
+            end = start
+            while end < len(self.data) and self.data[end] != 0:
+                end += 1
+        self.offset = end
+        text = bytes(self.data[start:self.offset]).decode('utf-8', errors='replace')
         self.offset += 1  # Skip null terminator
         return text
+    
+    def release(self):
+        """Release the buffer view (required before closing an mmap)."""
+        self.data.release()
 
 
-def parse_anonymous_bsv(data: bytes) -> Tuple[List[list], List[Tuple[int, Optional[int]]]]:
+def _read_bsv_header(parser: BSVParser) -> Tuple[int, List[Tuple[int, Optional[int]]]]:
     """
-    Parse an AnonymousSchemaBSV file matching bsv_parser.py logic
+    Validate and read an AnonymousSchemaBSV header
     
     Header structure (after magic + format byte):
         - header_size (2 bytes, big-endian)
@@ -284,9 +332,12 @@ def parse_anonymous_bsv(data: bytes) -> Tuple[List[list], List[Tuple[int, Option
         - schema_count (VLQ)
         - For each schema: type_byte (1 byte), optional fixed_size (VLQ)
     
+    Leaves the parser positioned at the first row.
+    
     Returns:
-        (list of rows, list of schemas as (type, fixed_size) tuples)
+        (row count, list of schemas as (type, fixed_size) tuples)
     """
+    data = parser.data
     if len(data) < 2:
         raise ValueError("BSV data too short")
     
@@ -303,7 +354,6 @@ def parse_anonymous_bsv(data: bytes) -> Tuple[List[list], List[Tuple[int, Option
     if format_type != BSV_FORMAT_ANONYMOUS:
         raise ValueError(f"Expected ANONYMOUS format ({BSV_FORMAT_ANONYMOUS}), got {format_type}")
     
-    parser = BSVParser(data)
     parser.offset = 2  # Skip magic + format byte
     
     # Read anonymous schema header
@@ -326,36 +376,79 @@ def parse_anonymous_bsv(data: bytes) -> Tuple[List[list], List[Tuple[int, Option
         
         schemas.append((type_byte, fixed_size))
     
-    # Read rows
-    rows = []
-    for _ in range(row_count):
-        row = []
-        for type_byte, fixed_size in schemas:
-            base_type = type_byte & 0xF0
-            
-            if type_byte == 0x40 or base_type == 0x40:  # TEXT (null-terminated)
-                text = parser.read_text()
-                row.append(text)
-            elif type_byte in (0x11, 0x12, 0x13) or base_type == 0x10:  # VLQ integer
-                value = parser.read_vlq()
-                row.append(value)
-            elif fixed_size is not None:  # Fixed-size integer
-                value = parser.read_unum(fixed_size)
-                row.append(value)
-            else:
-                raise ValueError(f"Unknown type: 0x{type_byte:02X}")
+    return row_count, schemas
+
+
+def _iter_rows(
+    parser: BSVParser,
+    row_count: int,
+    schemas: List[Tuple[int, Optional[int]]]
+) -> Iterator[list]:
+    """Yield rows from a parser positioned right after the header."""
+    if row_count == 0:
+        return
+    
+    # Resolve each column to a reader once instead of re-dispatching per cell
+    readers = []
+    for type_byte, fixed_size in schemas:
+        base_type = type_byte & 0xF0
         
-        rows.append(row)
+        if type_byte == 0x40 or base_type == 0x40:  # TEXT (null-terminated)
+            readers.append(parser.read_text)
+        elif type_byte in (0x11, 0x12, 0x13) or base_type == 0x10:  # VLQ integer
+            readers.append(parser.read_vlq)
+        elif fixed_size is not None:  # Fixed-size integer
+            readers.append(lambda n=fixed_size: parser.read_unum(n))
+        else:
+            raise ValueError(f"Unknown type: 0x{type_byte:02X}")
+    
+    for _ in range(row_count):
+        yield [read() for read in readers]
+
+
+def iter_bsv_rows(data: BSVBuffer) -> Iterator[list]:
+    """
+    Stream the rows of an AnonymousSchemaBSV buffer one at a time
+    
+    Works directly on bytes, a memoryview or an mmap without copying the
+    buffer, so memory stays flat regardless of manifest size. The buffer
+    view is released when the generator is exhausted or closed.
+    
+    Yields:
+        One list of column values per row
+    """
+    parser = BSVParser(data)
+    try:
+        row_count, schemas = _read_bsv_header(parser)
+        yield from _iter_rows(parser, row_count, schemas)
+    finally:
+        parser.release()
+
+
+def parse_anonymous_bsv(data: BSVBuffer) -> Tuple[List[list], List[Tuple[int, Optional[int]]]]:
+    """
+    Parse an AnonymousSchemaBSV file matching bsv_parser.py logic
+    
+    See _read_bsv_header() for the header layout; use iter_bsv_rows() to
+    stream rows without building the full list.
+    
+    Returns:
+        (list of rows, list of schemas as (type, fixed_size) tuples)
+    """
+    parser = BSVParser(data)
+    try:
+        row_count, schemas = _read_bsv_header(parser)
+        rows = list(_iter_rows(parser, row_count, schemas))
+    finally:
+        parser.release()
     
     return rows, schemas
 
 
-def parse_root_manifest(data: bytes) -> List[RootEntry]:
+def parse_root_manifest(data: BSVBuffer) -> List[RootEntry]:
     """Parse root manifest into RootEntry objects"""
-    rows, schemas = parse_anonymous_bsv(data)
-    
     entries = []
-    for row in rows:
+    for row in iter_bsv_rows(data):
         if len(row) >= 3:
             entries.append(RootEntry(
                 platform=row[0],
@@ -366,34 +459,89 @@ def parse_root_manifest(data: bytes) -> List[RootEntry]:
     return entries
 
 
-def parse_content_manifest(data: bytes) -> List[ManifestEntry]:
+def _optional_str(value) -> Optional[str]:
+    """Convert a manifest cell to str, or None if it is empty."""
+    if value is None or value == "":
+        return None
+    return str(value)
+
+
+def _optional_int(value) -> Optional[int]:
+    """Convert a manifest cell to int, or None if it is empty or not numeric."""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def iter_manifest_entries(data: BSVBuffer) -> Iterator[ManifestEntry]:
     """
-    Parse a content manifest (platform or category) into ManifestEntry objects
+    Stream a content manifest (platform or category) as ManifestEntry objects
     
     Handles both 3-column (simple) and 7-column (full asset) formats:
     - Simple: name, size, checksum
     - Full: name, deps, group, priority, size, checksum, key
+    
+    Closing this generator also closes the row iterator, releasing its view
+    of the buffer.
+    """
+    with closing(iter_bsv_rows(data)) as rows:
+        for row in rows:
+            if len(row) >= 7:
+                # Full asset format
+                yield ManifestEntry(
+                    name=row[0],
+                    size=row[4],
+                    checksum=row[5],
+                    group=_optional_str(row[2]),
+                    priority=_optional_int(row[3])
+                )
+            elif len(row) >= 3:
+                # Simple format
+                yield ManifestEntry(
+                    name=row[0],
+                    size=row[1],
+                    checksum=row[2]
+                )
+
+
+def parse_content_manifest(data: BSVBuffer) -> List[ManifestEntry]:
+    """Parse a content manifest into a list (see iter_manifest_entries())."""
+    return list(iter_manifest_entries(data))
+
+
+def select_entries(
+    entries: Iterable[ManifestEntry],
+    groups: Optional[Iterable[str]] = None,
+    max_priority: Optional[int] = None
+) -> List[ManifestEntry]:
     """
-    rows, schemas = parse_anonymous_bsv(data)
+    Filter manifest entries by group/priority and order them for download
     
-    entries = []
-    for row in rows:
-        if len(row) >= 7:
-            # Full asset format
-            entries.append(ManifestEntry(
-                name=row[0],
-                size=row[4],
-                checksum=row[5]
-            ))
-        elif len(row) >= 3:
-            # Simple format
-            entries.append(ManifestEntry(
-                name=row[0],
-                size=row[1],
-                checksum=row[2]
-            ))
+    Entries without group/priority columns (simple format) never match an
+    active filter. The result is sorted by ascending priority (lower value =
+    downloaded first), keeping manifest order within the same priority.
     
-    return entries
+    Args:
+        entries: Parsed manifest entries
+        groups: Groups to keep (None keeps all groups)
+        max_priority: Highest priority value to keep (None keeps all)
+    
+    Returns:
+        Selected entries in download order
+    """
+    wanted = set(groups) if groups else None
+    
+    selected = []
+    for entry in entries:
+        if wanted is not None and entry.group not in wanted:
+            continue
+        if max_priority is not None and (entry.priority is None or entry.priority > max_priority):
+            continue
+        selected.append(entry)
+    
+    selected.sort(key=lambda e: e.priority if e.priority is not None else sys.maxsize)
+    return selected
 
 
 # =============================================================================
@@ -422,40 +570,33 @@ def get_generic_url(hname: str) -> str:
 # MAIN PIPELINE
 # =============================================================================
 
-def fetch_master_db(
+def fetch_category_manifest(
     app_ver: str,
-    platform: str = DEFAULT_PLATFORM,
-    output_dir: str = ".",
-    verbose: bool = True
-) -> str:
+    platform: str,
+    category: str,
+    output_dir: str,
+    log: Callable[[str], None]
+) -> List[ManifestEntry]:
     """
-    Fetch master.mdb by following the manifest chain
+    Follow the manifest chain down to one content category manifest
     
     Steps:
         1. Download root manifest
-        2. Parse to get platform manifest hname
-        3. Download platform manifest  
-        4. Find "master" entry
-        5. Download master manifest
-        6. Find "master.mdb.lz4" entry
-        7. Download and decompress to master.mdb
+        2. Parse to get platform manifest hname, download platform manifest
+        3. Find the category entry, download its manifest
+    
+    Each manifest is saved to output_dir as it is fetched.
     
     Args:
         app_ver: Application version (e.g., "10004010")
         platform: Target platform (Windows, iOS, Android)
-        output_dir: Directory to save output files
-        verbose: Print progress messages
+        category: Content category in the platform manifest (e.g., "master")
+        output_dir: Directory to save manifest files
+        log: Progress message callback
     
     Returns:
-        Path to the downloaded master.mdb file
+        Entries of the category manifest
     """
-    
-    def log(msg: str):
-        if verbose:
-            print(msg)
-    
-    os.makedirs(output_dir, exist_ok=True)
-    
     # ==========================================================================
     # STEP 1: Download Root Manifest
     # ==========================================================================
@@ -527,46 +668,87 @@ def fetch_master_db(
         log(f"  - {entry.name}: size={entry.size:,}, hname={entry.hname}")
     
     # ==========================================================================
-    # STEP 3: Download Master Manifest
+    # STEP 3: Download Category Manifest
     # ==========================================================================
     log("\n" + "=" * 70)
-    log("STEP 3: Downloading Master Manifest")
+    log(f"STEP 3: Downloading {category.capitalize()} Manifest")
     log("=" * 70)
     
-    # Find "master" entry
-    master_entry = None
+    # Find category entry
+    category_entry = None
     for entry in platform_entries:
-        if entry.name.lower() == "master":
-            master_entry = entry
+        if entry.name.lower() == category.lower():
+            category_entry = entry
             break
     
-    if not master_entry:
-        raise ValueError("'master' entry not found in platform manifest")
+    if not category_entry:
+        raise ValueError(f"'{category}' entry not found in platform manifest")
     
-    master_manifest_url = get_manifest_url(master_entry.hname)
-    log(f"Master entry: size={master_entry.size}, checksum=0x{master_entry.checksum:016X}")
-    log(f"HName: {master_entry.hname}")
-    log(f"URL: {master_manifest_url}")
+    category_manifest_url = get_manifest_url(category_entry.hname)
+    log(f"{category.capitalize()} entry: size={category_entry.size}, checksum=0x{category_entry.checksum:016X}")
+    log(f"HName: {category_entry.hname}")
+    log(f"URL: {category_manifest_url}")
     
-    master_manifest_data = download_file(master_manifest_url)
-    log(f"Downloaded: {len(master_manifest_data):,} bytes")
+    category_manifest_data = download_file(category_manifest_url)
+    log(f"Downloaded: {len(category_manifest_data):,} bytes")
     
     # Decompress if LZ4 compressed
-    if is_lz4_compressed(master_manifest_data):
-        master_manifest_data = decompress_lz4(master_manifest_data)
-        log(f"Decompressed: {len(master_manifest_data):,} bytes")
-    
-    # Save master manifest
-    master_manifest_path = os.path.join(output_dir, "master.manifest.bsv")
-    with open(master_manifest_path, 'wb') as f:
-        f.write(master_manifest_data)
-    log(f"Saved: {master_manifest_path}")
-    
-    # Parse master manifest
-    master_entries = parse_content_manifest(master_manifest_data)
-    log(f"\nFound {len(master_entries)} entries in master manifest:")
-    for entry in master_entries:
+    if is_lz4_compressed(category_manifest_data):
+        category_manifest_data = decompress_lz4(category_manifest_data)
+        log(f"Decompressed: {len(category_manifest_data):,} bytes")
+    
+    # Save category manifest
+    category_manifest_path = os.path.join(output_dir, f"{category}.manifest.bsv")
+    with open(category_manifest_path, 'wb') as f:
+        f.write(category_manifest_data)
+    log(f"Saved: {category_manifest_path}")
+    
+    # Parse category manifest
+    category_entries = parse_content_manifest(category_manifest_data)
+    log(f"\nFound {len(category_entries)} entries in {category} manifest:")
+    for entry in category_entries[:LOG_ENTRY_LIMIT]:
         log(f"  - {entry.name}: size={entry.size:,}, hname={entry.hname}")
+    if len(category_entries) > LOG_ENTRY_LIMIT:
+        log(f"  ... and {len(category_entries) - LOG_ENTRY_LIMIT:,} more")
+    
+    return category_entries
+
+
+def fetch_master_db(
+    app_ver: str,
+    platform: str = DEFAULT_PLATFORM,
+    output_dir: str = ".",
+    verbose: bool = True
+) -> str:
+    """
+    Fetch master.mdb by following the manifest chain
+    
+    Steps:
+        1. Download root manifest
+        2. Parse to get platform manifest hname
+        3. Download platform manifest  
+        4. Find "master" entry
+        5. Download master manifest
+        6. Find "master.mdb.lz4" entry
+        7. Download and decompress to master.mdb
+    
+    Args:
+        app_ver: Application version (e.g., "10004010")
+        platform: Target platform (Windows, iOS, Android)
+        output_dir: Directory to save output files
+        verbose: Print progress messages
+    
+    Returns:
+        Path to the downloaded master.mdb file
+    """
+    
+    def log(msg: str):
+        if verbose:
+            print(msg)
+    
+    os.makedirs(output_dir, exist_ok=True)
+    
+    master_entries = fetch_category_manifest(app_ver, platform, "master", output_dir, log)
     
     # ==========================================================================
     # STEP 4: Download master.mdb.lz4
@@ -617,6 +799,266 @@ def fetch_master_db(
     return mdb_path
 
 
+def sync_assets(
+    app_ver: str,
+    category: str = "master",
+    platform: str = DEFAULT_PLATFORM,
+    output_dir: str = ".",
+    groups: Optional[Iterable[str]] = None,
+    max_priority: Optional[int] = None,
+    verbose: bool = True
+) -> List[str]:
+    """
+    Selectively sync the assets of one content category
+    
+    Follows the manifest chain with fetch_category_manifest(), then downloads
+    only the entries picked by select_entries() from their Generic URLs, in
+    priority order. Assets are saved as downloaded (no decompression) under
+    output_dir, keyed by their manifest name.
+    
+    Each completed download is appended to a sync index (SYNC_INDEX_NAME) in
+    output_dir, recording the asset's hname. Since the hname is derived from
+    checksum, size and name, an asset is skipped only if the file exists and
+    its recorded hname matches the manifest; any content change between app
+    versions triggers a re-download. Responses whose length differs from the
+    manifest size are rejected rather than saved.
+    
+    Args:
+        app_ver: Application version (e.g., "10004010")
+        category: Content category in the platform manifest (e.g., "master")
+        platform: Target platform (Windows, iOS, Android)
+        output_dir: Directory to save output files
+        groups: Groups to keep (None keeps all groups)
+        max_priority: Highest priority value to keep (None keeps all)
+        verbose: Print progress messages
+    
+    Returns:
+        Paths of the selected assets, in download order
+    
+    Raises:
+        ValueError: If a group/priority filter is set but the category
+            manifest has no such column
+    """
+    
+    def log(msg: str):
+        if verbose:
+            print(msg)
+    
+    os.makedirs(output_dir, exist_ok=True)
+    
+    entries = fetch_category_manifest(app_ver, platform, category, output_dir, log)
+    
+    # Filters need the full asset format; on a simple manifest they would match nothing
+    if groups and not any(e.group is not None for e in entries):
+        raise ValueError(f"'{category}' manifest has no group column; cannot filter by group")
+    if max_priority is not None and not any(e.priority is not None for e in entries):
+        raise ValueError(f"'{category}' manifest has no priority column; cannot filter by priority")
+    
+    selected = select_entries(entries, groups=groups, max_priority=max_priority)
+    total_size = sum(e.size for e in selected)
+    log(f"Selected {len(selected)} of {len(entries)} entries ({total_size:,} bytes)")
+    
+    # Load the sync index (last record per name wins)
+    root = Path(output_dir).resolve()
+    index_path = root / SYNC_INDEX_NAME
+    synced = {}
+    if index_path.is_file():
+        with open(index_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                    synced[record["name"]] = record["hname"]
+                except (ValueError, KeyError, TypeError):
+                    continue  # Ignore a torn trailing line from an interrupted run
+    
+    # Download selected assets, highest priority first
+    paths = []
+    with open(index_path, 'a', encoding='utf-8') as index_file:
+        for index, entry in enumerate(selected, 1):
+            asset_path = (root / entry.name).resolve()
+            if root not in asset_path.parents:
+                raise ValueError(f"Refusing to write outside output directory: {entry.name!r}")
+            
+            progress = f"[{index}/{len(selected)}]"
+            if synced.get(entry.name) == entry.hname and asset_path.is_file():
+                log(f"{progress} up to date: {entry.name}")
+            else:
+                log(f"{progress} p={entry.priority} g={entry.group} {entry.name} ({entry.size:,} bytes)")
+                data = download_file(get_generic_url(entry.hname))
+                if len(data) != entry.size:
+                    raise RuntimeError(
+                        f"Size mismatch for {entry.name}: expected {entry.size:,} bytes, got {len(data):,}"
+                    )
+                
+                asset_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(asset_path, 'wb') as f:
+                    f.write(data)
+                
+                # Record only after the asset is fully written
+                index_file.write(json.dumps({"name": entry.name, "hname": entry.hname}) + "\n")
+                index_file.flush()
+                synced[entry.name] = entry.hname
+            
+            paths.append(str(asset_path))
+    
+    # Compact the index to one record per asset
+    tmp_path = index_path.with_suffix(".tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        for name, hname in synced.items():
+            f.write(json.dumps({"name": name, "hname": hname}) + "\n")
+    os.replace(tmp_path, index_path)
+    
+    return paths
+
+
+# =============================================================================
+# MANIFEST DUMP
+# =============================================================================
+
+DUMP_FORMATS = ("jsonl", "csv")
+ENTRY_FIELDS = ("name", "size", "checksum", "hname", "group", "priority")
+
+# Width of 64-bit fixed-size columns (checksums, keys); JSON.parse and jq read
+# numbers as doubles, so these are written as decimal strings in JSON Lines
+WIDE_INT_SIZE = 8
+
+
+def dump_manifest(path: str, out: TextIO, fmt: str = "jsonl", entries: bool = False) -> int:
+    """
+    Stream a saved .manifest.bsv file out as JSON Lines or CSV
+    
+    The file is mmapped and rows are written as they are decoded, so memory
+    use stays constant regardless of manifest size.
+    
+    In JSON Lines output, 64-bit columns are written as decimal strings on
+    every row so JSON.parse and jq can't round them: the checksum field with
+    --entries, and every fixed-size 8-byte column (per the file's schema) in
+    raw rows. VLQ integers (sizes, groups, priorities) stay numbers. CSV
+    output is unaffected.
+    
+    Args:
+        path: Path to a decompressed .manifest.bsv file
+        out: Text stream to write to
+        fmt: Output format ("jsonl" or "csv")
+        entries: Emit ManifestEntry fields (with hname) instead of raw rows
+    
+    Returns:
+        Number of rows written
+    """
+    if fmt not in DUMP_FORMATS:
+        raise ValueError(f"Unknown dump format: {fmt!r} (expected one of {', '.join(DUMP_FORMATS)})")
+    
+    count = 0
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if entries:
+            wide_columns = {ENTRY_FIELDS.index("checksum")}
+        else:
+            parser = BSVParser(mm)
+            try:
+                _, schemas = _read_bsv_header(parser)
+            finally:
+                parser.release()
+            wide_columns = {
+                i for i, (_, fixed_size) in enumerate(schemas) if fixed_size == WIDE_INT_SIZE
+            }
+        
+        if fmt == "csv":
+            writer = csv.writer(out)
+            if entries:
+                writer.writerow(ENTRY_FIELDS)
+            write = writer.writerow
+        else:
+            def write(values):
+                for i in wide_columns:
+                    if isinstance(values[i], int):
+                        values[i] = str(values[i])
+                record = dict(zip(ENTRY_FIELDS, values)) if entries else values
+                out.write(json.dumps(record, ensure_ascii=False))
+                out.write("\n")
+        
+        if entries:
+            records = iter_manifest_entries(mm)
+        else:
+            records = iter_bsv_rows(mm)
+        
+        # closing() releases the parser's view before the mmap is closed
+        with closing(records):
+            for record in records:
+                if entries:
+                    record = [getattr(record, field) for field in ENTRY_FIELDS]
+                write(record)
+                count += 1
+    
+    return count
+
+
+def dump_main(argv: List[str]) -> int:
+    """
+    Entry point for the ``dump`` subcommand.
+    
+    Returns:
+        Exit code (0 for success, 1 for error)
+    """
+    parser = argparse.ArgumentParser(
+        prog=f"{os.path.basename(sys.argv[0])} dump",
+        description="Stream a saved .manifest.bsv file as JSON Lines or CSV",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+    %(prog)s master.manifest.bsv
+    %(prog)s Windows.manifest.bsv --entries | jq .name
+    %(prog)s chara.manifest.bsv --format csv --output chara.csv
+        """
+    )
+    
+    parser.add_argument(
+        "manifest",
+        help="Path to a decompressed .manifest.bsv file"
+    )
+    
+    parser.add_argument(
+        "--format", "-f",
+        default="jsonl",
+        choices=DUMP_FORMATS,
+        help="Output format (default: jsonl)"
+    )
+    
+    parser.add_argument(
+        "--entries", "-e",
+        action="store_true",
+        help="Emit manifest entries (name, size, checksum, hname, group, priority) instead of raw rows"
+    )
+    
+    parser.add_argument(
+        "--output", "-o",
+        default=None,
+        help="Output file (default: stdout)"
+    )
+    
+    args = parser.parse_args(argv)
+    
+    try:
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8', newline='') as out:
+                dump_manifest(args.manifest, out, fmt=args.format, entries=args.entries)
+        else:
+            if args.format == "csv":
+                # csv writes its own \r\n; don't let Windows translate it again
+                sys.stdout.reconfigure(newline='')
+            dump_manifest(args.manifest, sys.stdout, fmt=args.format, entries=args.entries)
+        return 0
+    
+    except BrokenPipeError:
+        # Downstream consumer (e.g. head) stopped reading early; point stdout
+        # at devnull so the interpreter's shutdown flush doesn't fail again
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 0
+    
+    except Exception as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 1
+
+
 # =============================================================================
 # CLI
 # =============================================================================
@@ -628,6 +1070,9 @@ def main() -> int:
     Returns:
         Exit code (0 for success, 1 for error)
     """
+    if sys.argv[1:2] == ["dump"]:
+        return dump_main(sys.argv[2:])
+    
     parser = argparse.ArgumentParser(
         description="Fetch master.mdb from Uma Musume manifest chain",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -636,6 +1081,8 @@ Examples:
     %(prog)s 10004010
     %(prog)s 10004010 --output ./downloads
     %(prog)s 10004010 --platform Android --quiet
+    %(prog)s 10004010 --category chara --group 1 --max-priority 10
+    %(prog)s dump master.manifest.bsv --format jsonl
 
 Manifest Chain:
     Root Manifest → Platform Manifest → Master Manifest → master.mdb
@@ -660,6 +1107,27 @@ Manifest Chain:
         help=f"Target platform (default: {DEFAULT_PLATFORM})"
     )
     
+    parser.add_argument(
+        "--category", "-c",
+        default=None,
+        help="Content category to selectively sync (default: master when filtering)"
+    )
+    
+    parser.add_argument(
+        "--group", "-g",
+        action="append",
+        dest="groups",
+        metavar="GROUP",
+        help="Only sync assets in this group (repeatable)"
+    )
+    
+    parser.add_argument(
+        "--max-priority",
+        type=int,
+        default=None,
+        help="Only sync assets with priority <= this value"
+    )
+    
     parser.add_argument(
         "--quiet", "-q",
         action="store_true",
@@ -668,7 +1136,22 @@ Manifest Chain:
     
     args = parser.parse_args()
     
+    selective = args.category is not None or args.groups or args.max_priority is not None
+    
     try:
+        if selective:
+            paths = sync_assets(
+                app_ver=args.app_ver,
+                category=args.category or "master",
+                platform=args.platform,
+                output_dir=args.output,
+                groups=args.groups,
+                max_priority=args.max_priority,
+                verbose=not args.quiet
+            )
+            print(f"\nSynced {len(paths)} asset(s) to: {args.output}")
+            return 0
+        
         output_path = fetch_master_db(
             app_ver=args.app_ver,
             platform=args.platform,